@@ -25,15 +25,38 @@ Config expectations (in your config.py):
 - Optional: WS2812_MATRIX_WIDTH (int), WS2812_ZIGZAG (bool), WS2812_ORIGIN (str)
 """
 
+import os
 import time
-import random
+import array
 
 try:
     import board
     import neopixel
+    from micropython import const
 except Exception as e:  # pragma: no cover
     raise RuntimeError("This module requires CircuitPython with neopixel + board available") from e
 
+_NS_PER_S = const(1_000_000_000)
+# column-mode band boundaries are re-rolled once every this many frames
+_BAND_FRAMES = const(4)
+
+
+def _index_table(values):
+    """Pack a flat index table as bytes when every entry fits in a byte
+    (strips and matrices up to 256 LEDs), else as array('H')."""
+    values = list(values)
+    if not values or max(values) < 256:
+        return bytes(values)
+    return array.array("H", values)
+
+
+def _xorshift32(s: int) -> int:
+    """Next state of a 32-bit xorshift PRNG (state must be non-zero)."""
+    s ^= (s << 13) & 0xFFFFFFFF
+    s ^= s >> 17
+    s ^= (s << 5) & 0xFFFFFFFF
+    return s
+
 
 class FlameWS2812:
     def __init__(
@@ -52,20 +75,24 @@ class FlameWS2812:
         spark_count: int = 2,
         spark_min: int = 160,
         spark_max: int = 255,
+        seed: int | None = None,
     ):
         self.cfg = config_module
         if not getattr(self.cfg, "ENABLE_WS2812", False):
             raise RuntimeError("ENABLE_WS2812 is False in config.py")
 
         self.target_fps = target_fps
-        self.frame_duration = 1.0 / float(target_fps)
+        self.frame_duration = 1.0 / float(target_fps)  # legacy; pacing uses frame_duration_ns
+        self.frame_duration_ns = _NS_PER_S // int(target_fps)
 
         self.num_pixels = getattr(self.cfg, "WS2812_NUM_PIXELS")
         pin_name = getattr(self.cfg, "WS2812_PIN")
         pin = getattr(board, pin_name)
 
         self.pixels = neopixel.NeoPixel(pin, self.num_pixels, brightness=0.5, auto_write=False)
-        self.heat = [0] * self.num_pixels
+        # heat per cell, 0..255 unboxed bytes; every store must be clamped to
+        # that range (bytearray raises ValueError otherwise)
+        self.heat = bytearray(self.num_pixels)
 
         # Matrix/strip geometry
         self.width = matrix_width  # None => 1D strip
@@ -73,18 +100,75 @@ class FlameWS2812:
         self.origin = origin.lower()
         self.height = (self.num_pixels // self.width) if self.width else 1
 
+        # Precomputed (row, col) -> LED index map, flat as idx_map[row * width + col];
+        # strips render straight to LED order and leave it empty
+        if self.width:
+            self._idx_map = _index_table(
+                [self._index(r, c) for r in range(self.height) for c in range(self.width)]
+            )
+        else:
+            self._idx_map = _index_table([])
+        # heat buffer position sampled by each matrix LED, indexed by LED so the
+        # heat render needs no idx_map lookup: cell (row, col) samples
+        # heat[row + col], clamped to the buffer
+        last = self.num_pixels - 1
+        src = []
+        if self.width:
+            src = [0] * len(self._idx_map)
+            for r in range(self.height):
+                for c in range(self.width):
+                    src[self._idx_map[r * self.width + c]] = min(last, r + c)
+        self._src_lut = _index_table(src)
+
+        # heat value -> packed 0xRRGGBB color, built once so renderers never
+        # call heat_ramp; small ints need no allocation and NeoPixel takes
+        # them without unpacking a tuple
+        self._ramp = tuple(
+            (r << 16) | (g << 8) | b for r, g, b in (FlameWS2812.heat_ramp(v) for v in range(256))
+        )
+        # frame staging list, pushed to the strip with one slice assignment
+        self._frame = [0] * self.num_pixels
+
         # Render & physics params
         self.mode = mode  # "columns" or "heat"
         self.cool_max = int(cool_max)
         self.spark_count = int(spark_count)
         self.spark_min = int(spark_min)
         self.spark_max = int(spark_max)
+        self._spark_max_idx = min(2, self.num_pixels - 1)
+
+        # Cooling noise: a fixed pool of xorshift32 bytes, read each frame at
+        # an offset picked by one more xorshift step. The pool holds 256
+        # distinct n-byte windows. seed fixes only this cooling sequence;
+        # sparks and column colors still come from os.urandom each frame.
+        if seed is None:
+            seed = int.from_bytes(os.urandom(4), "little")
+        s = (seed & 0xFFFFFFFF) or 0x9E3779B9
+        noise = bytearray(self.num_pixels + 256)
+        for i in range(len(noise)):
+            s = _xorshift32(s)
+            noise[i] = s & 0xFF
+        self._noise = noise
+        self._rng_state = s
+
+        # random bytes consumed per frame: sparks, column colors, then column
+        # band boundaries on refresh frames
+        self._rnd_physics = 2 * self.spark_count
+        self._rnd_columns = self.width * self.height if self.width else 0
+        self._rnd_bands = 2 * self.width if self.width else 0
+
+        # column-mode band ends (row indices), refreshed every _BAND_FRAMES
+        self._band_yellow = bytearray([1] * (self.width or 0))
+        self._band_orange = bytearray([min(self.height, 2)] * (self.width or 0))
+        self._frame_count = 0
 
         # brightness shimmer
         self.brightness = shimmer_min
         self.brightness_dir = abs(shimmer_step)
         self.shimmer_min = float(shimmer_min)
         self.shimmer_max = float(shimmer_max)
+        # _shimmer() only assigns on change, so a steady flame needs this once
+        self.pixels.brightness = self.brightness
 
     # -------------------------- Mapping --------------------------
     def _index(self, row: int, col: int) -> int:
@@ -125,20 +209,62 @@ class FlameWS2812:
         return (v + 16, 0, 0)   # deep red -> red
 
     # -------------------------- Physics --------------------------
-    def _flame_physics(self) -> None:
-        # cooling
-        for i in range(self.num_pixels):
-            self.heat[i] = max(0, self.heat[i] - random.randint(0, self.cool_max))
-        # diffusion upwards along the 1D buffer
-        for i in range(self.num_pixels - 1, 2, -1):
-            self.heat[i] = (self.heat[i - 1] + self.heat[i - 2] + self.heat[i - 2]) // 3
-        # base sparks
+    def _flame_physics(self, rnd) -> None:
+        """Advance the heat buffer one frame using the first
+        ``_rnd_physics`` bytes of ``rnd``."""
+        heat = self.heat
+        n = self.num_pixels
+        # cooling: an n-byte window of the noise pool scaled to 0..cool_max
+        cool = self.cool_max + 1
+        s = _xorshift32(self._rng_state)
+        self._rng_state = s
+        noise = self._noise
+        o = s & 0xFF
+        # cooling + diffusion upwards along the 1D buffer, fused into a single
+        # descending pass: below i the buffer still holds last frame's values,
+        # so each cell is cooled once and carried in a/b to the two cells
+        # above it that blend it in
+        if n > 3:
+            a = heat[n - 2] - ((noise[o + n - 2] * cool) >> 8)
+            if a < 0:
+                a = 0
+            for i in range(n - 1, 2, -1):
+                b = heat[i - 2] - ((noise[o + i - 2] * cool) >> 8)
+                if b < 0:
+                    b = 0
+                # plain // 3: in bytecode the * 0x5556 >> 16 form is an extra
+                # opcode, and the RP2040 divides in hardware anyway
+                heat[i] = (a + b + b) // 3
+                a = b
+        # the base cells are never diffused into, only cooled
+        for i in range(min(3, n)):
+            v = heat[i] - ((noise[o + i] * cool) >> 8)
+            heat[i] = v if v > 0 else 0
+        # base sparks: two bytes each (position, strength), scaled into range
+        spark_min = self.spark_min
+        spark_span = self.spark_max - spark_min + 1
+        idx_span = self._spark_max_idx + 1
+        ri = 0
         for _ in range(self.spark_count):
-            idx = random.randint(0, min(2, self.num_pixels - 1))
-            self.heat[idx] = min(255, self.heat[idx] + random.randint(self.spark_min, self.spark_max))
+            idx = (rnd[ri] * idx_span) >> 8
+            heat[idx] = min(255, heat[idx] + spark_min + ((rnd[ri + 1] * spark_span) >> 8))
+            ri += 2
 
     # -------------------------- Rendering ------------------------
-    def _render_columns(self) -> None:
+    def _shimmer(self) -> None:
+        """Advance the brightness shimmer."""
+        brightness = self.brightness + self.brightness_dir
+        if brightness >= self.shimmer_max or brightness <= self.shimmer_min:
+            self.brightness_dir *= -1
+        if brightness == self.brightness:
+            return
+        self.brightness = brightness
+        # PixelBuf rescales its whole buffer on every brightness assignment
+        self.pixels.brightness = brightness
+
+    def _render_columns(self, rnd, ri: int, refresh_bands: bool) -> None:
+        """Render column bands from the random bytes of ``rnd`` starting at ``ri``:
+        one per pixel, then 2 per column for new band ends if ``refresh_bands``."""
         if not self.width:
             # 1D: fall back to heat render to map physics directly
             self._render_heat()
@@ -146,69 +272,95 @@ class FlameWS2812:
 
         width = self.width
         height = self.height
+        pixels = self.pixels
+        frame = self._frame
+        idx_map = self._idx_map
+        ramp = self._ramp
+
+        self._shimmer()
+
+        # Per-column color bands (yellow/orange/red) from base upwards; the
+        # band ends only move on refresh frames
+        band_yellow = self._band_yellow
+        band_orange = self._band_orange
+        if refresh_bands:
+            bi = ri + width * height
+            yellow_span = min(2, height)
+            for col in range(width):
+                yellow_end = 1 + rnd[bi] % yellow_span
+                band_yellow[col] = yellow_end
+                band_orange[col] = min(height, yellow_end + 1 + rnd[bi + 1] % 3)
+                bi += 2
 
-        # Brightness shimmer
-        self.brightness += self.brightness_dir
-        if self.brightness >= self.shimmer_max or self.brightness <= self.shimmer_min:
-            self.brightness_dir *= -1
-        self.pixels.brightness = self.brightness
-
-        # Per-column color bands (yellow/orange/red) from base upwards
+        # One random byte per pixel for its color within its band
         for col in range(width):
-            yellow_end = random.randint(1, min(2, height))
-            orange_end = min(height, yellow_end + random.randint(1, 3))
+            yellow_end = band_yellow[col]
+            orange_end = band_orange[col]
+            i = col
             for row in range(height):
-                idx = self._index(row, col)
+                idx = idx_map[i]
+                i += width
                 if row < yellow_end:
-                    self.pixels[idx] = self.heat_ramp(random.randint(120, 150))
+                    frame[idx] = ramp[120 + rnd[ri] % 31]
                 elif row < orange_end:
-                    self.pixels[idx] = self.heat_ramp(random.randint(85, 120))
+                    frame[idx] = ramp[85 + rnd[ri] % 36]
                 else:
-                    self.pixels[idx] = self.heat_ramp(random.randint(0, 85))
-        self.pixels.show()
+                    frame[idx] = ramp[rnd[ri] % 86]
+                ri += 1
+        pixels[:] = frame
+        pixels.show()
 
     def _render_heat(self) -> None:
-        # Brightness shimmer
-        self.brightness += self.brightness_dir
-        if self.brightness >= self.shimmer_max or self.brightness <= self.shimmer_min:
-            self.brightness_dir *= -1
-        self.pixels.brightness = self.brightness
+        pixels = self.pixels
+        frame = self._frame
+        ramp = self._ramp
+        heat = self.heat
+
+        self._shimmer()
 
         if not self.width:
             # 1D: map heat directly
             for i in range(self.num_pixels):
-                self.pixels[i] = self.heat_ramp(self.heat[i])
+                frame[i] = ramp[heat[i]]
         else:
-            width = self.width
-            height = self.height
+            src_lut = self._src_lut
             # project 1D heat up the columns (simple gradient per row)
-            # bottom rows use hotter values; upper rows use cooler values
-            for col in range(width):
-                for row in range(height):
-                    # sample a position along the heat buffer
-                    src = min(self.num_pixels - 1, row + col)  # cheap varying sample
-                    self.pixels[self._index(row, col)] = self.heat_ramp(self.heat[src])
-        self.pixels.show()
+            for i in range(len(src_lut)):
+                frame[i] = ramp[heat[src_lut[i]]]
+        pixels[:] = frame
+        pixels.show()
 
     # -------------------------- Main loop ------------------------
     def step(self) -> None:
-        start = time.monotonic()
-        self._flame_physics()
-        if self.mode == "columns":
-            self._render_columns()
+        start = time.monotonic_ns()
+        # one RNG call per frame covers sparks and rendering
+        columns = self.mode == "columns"
+        rnd_physics = self._rnd_physics
+        need = rnd_physics
+        refresh_bands = False
+        if columns:
+            need += self._rnd_columns
+            refresh_bands = self._frame_count % _BAND_FRAMES == 0
+            if refresh_bands:
+                need += self._rnd_bands
+        self._frame_count += 1
+        rnd = os.urandom(need)
+        self._flame_physics(rnd)
+        if columns:
+            self._render_columns(rnd, rnd_physics, refresh_bands)
         else:
             self._render_heat()
-        # cap FPS
-        elapsed = time.monotonic() - start
-        rem = self.frame_duration - elapsed
+        # cap FPS (integer ns: no float math, no precision loss on long uptimes)
+        rem = self.frame_duration_ns - (time.monotonic_ns() - start)
         if rem > 0:
-            time.sleep(rem)
+            time.sleep(rem / _NS_PER_S)
 
     def run(self, duration: float | None = None) -> None:
-        start = time.monotonic()
+        start = time.monotonic_ns()
+        duration_ns = None if duration is None else int(duration * _NS_PER_S)
         while True:
             self.step()
-            if duration is not None and (time.monotonic() - start) >= duration:
+            if duration_ns is not None and (time.monotonic_ns() - start) >= duration_ns:
                 break
 
 